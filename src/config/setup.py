@@ -1,11 +1,25 @@
 from src.config.logging import logger
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+import tempfile
+import hashlib
+import pickle
 import yaml
 import os
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 SETUP_CONFIG_PATH = './config/setup.yml'
 SERVING_CONFIG_PATH = './config/serve.yml'
 
+# Prefer the libyaml-backed loader; falls back to the pure-Python one when libyaml is unavailable.
+_LOADER = SafeLoader
+
+# Parsed configs are pickled here so unchanged YAML files are not re-parsed on every process launch.
+CONFIG_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'timesfm')
+
 class _Config:
     """
     Singleton class to manage application configuration for project and models.
@@ -25,8 +39,12 @@ class _Config:
 
     Methods:
     --------
-    _load_config(config_path: str) -> Dict[str, Any]:
-        Load the YAML configuration from the given path.
+    _load_config(config_path: str, loader: type) -> Dict[str, Any]:
+        Load the YAML configuration from the given path, reusing a cached parse when the file is unchanged.
+    _config_cache_path(config_path: str) -> str:
+        Build the cache file path for a config keyed by its path, mtime and size.
+    _write_config_cache(cache_path: str, config_data: Dict[str, Any]) -> None:
+        Atomically write the parsed configuration to the cache.
     _set_google_credentials(credentials_path: str) -> None:
         Set the Google application credentials environment variable.
     """
@@ -48,8 +66,8 @@ class _Config:
         self.__initialized = True
 
         # Load setup and models configurations
-        self.__setup_config = self._load_config(SETUP_CONFIG_PATH)
-        self.__hosting_config = self._load_config(SERVING_CONFIG_PATH)
+        self.__setup_config = self._load_config(SETUP_CONFIG_PATH, _LOADER)
+        self.__hosting_config = self._load_config(SERVING_CONFIG_PATH, _LOADER)
 
         # Project-level configuration
         self.PROJECT_ID = self.__setup_config['project_id']
@@ -76,14 +94,20 @@ class _Config:
         self._set_google_credentials(self.CREDENTIALS_PATH)
 
     @staticmethod
-    def _load_config(config_path: str) -> Dict[str, Any]:
+    def _load_config(config_path: str, loader: type = _LOADER) -> Dict[str, Any]:
         """
         Load the YAML configuration from the given path.
 
+        The parsed result is pickled under CONFIG_CACHE_DIR, keyed by the file's path,
+        modification time and size, so subsequent processes skip YAML parsing until the
+        file changes. Cache read/write failures fall back to a regular parse.
+
         Parameters:
         -----------
         config_path : str
             Path to the YAML configuration file.
+        loader : type, optional
+            The PyYAML loader class used for parsing, by default the C-accelerated safe loader.
 
         Returns:
         --------
@@ -96,12 +120,74 @@ class _Config:
             If the configuration file fails to load, logs the error.
         """
         try:
+            cache_path = _Config._config_cache_path(config_path)
+            if cache_path is not None:
+                try:
+                    with open(cache_path, 'rb') as cache_file:
+                        return pickle.load(cache_file)
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable config cache {cache_path}. Error: {e}")
+
             with open(config_path, 'r') as file:
-                return yaml.safe_load(file)
+                config_data = yaml.load(file, Loader=loader)
+
+            if cache_path is not None:
+                _Config._write_config_cache(cache_path, config_data)
+            return config_data
         except Exception as e:
             logger.error(f"Failed to load the configuration file at {config_path}. Error: {e}")
             raise
 
+    @staticmethod
+    def _config_cache_path(config_path: str) -> Optional[str]:
+        """
+        Build the cache file path for a config file keyed by its path, mtime and size.
+
+        Parameters:
+        -----------
+        config_path : str
+            Path to the YAML configuration file.
+
+        Returns:
+        --------
+        Optional[str]
+            Path of the pickle cache file, or None if the config file cannot be stat'ed.
+        """
+        try:
+            st = os.stat(config_path)
+        except OSError:
+            return None
+        raw_key = f"{os.path.abspath(config_path)}:{st.st_mtime_ns}:{st.st_size}"
+        key = hashlib.blake2b(raw_key.encode()).hexdigest()[:16]
+        return os.path.join(CONFIG_CACHE_DIR, f"cfg_{key}.pkl")
+
+    @staticmethod
+    def _write_config_cache(cache_path: str, config_data: Dict[str, Any]) -> None:
+        """
+        Atomically write the parsed configuration to the cache (temp file + rename).
+
+        Parameters:
+        -----------
+        cache_path : str
+            Destination path of the pickle cache file.
+        config_data : Dict[str, Any]
+            Parsed configuration data to cache.
+        """
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as tmp_file:
+                    pickle.dump(config_data, tmp_file, protocol=5)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            logger.warning(f"Failed to write config cache {cache_path}. Error: {e}")
+
     @staticmethod
     def _set_google_credentials(credentials_path: str) -> None:
         """
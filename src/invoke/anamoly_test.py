@@ -1,8 +1,13 @@
 from src.invoke.helper import create_vertex_ai_predictor
 from src.utils.inference import get_endpoint_name
 from src.invoke.helper import make_inference
+from src.invoke.helper import build_forecast_frame
 from src.invoke.helper import Visualizer
+from src.utils.io import read_csv_cached
 from src.config.logging import logger
+from pathlib import Path
+from typing import Optional
+import numpy as np
 import os
 import pandas as pd
 
@@ -15,23 +20,27 @@ def load_temperature_data(file_path: str) -> pd.DataFrame:
     :return: A Pandas DataFrame with the loaded data.
     :raises FileNotFoundError: If the file does not exist.
     """
-    if not os.path.exists(file_path):
-        logger.error("Temperature data file not found: %s", file_path)
-        raise FileNotFoundError(f"File not found: {file_path}")
-    
     logger.info("Loading temperature data from: %s", file_path)
-    return pd.read_csv(file_path)
+    try:
+        # Dates stay as "%Y-%m-%d" strings and temperatures as float64, since both are sent to the endpoint verbatim
+        return read_csv_cached(file_path, usecols=["date", "meantemp"], dtype={"meantemp": "float64"})
+    except FileNotFoundError:
+        logger.error("Temperature data file not found: %s", file_path)
+        raise
 
 
 def prepare_instances(data: pd.DataFrame) -> tuple:
     """
     Prepares input data, timestamps, and ground truths for prediction and visualization.
 
+    Slices are NumPy views over the underlying columns; conversion to Python lists is
+    deferred until `make_inference` sends the request.
+
     :param data: A Pandas DataFrame containing temperature and date columns.
     :return: A tuple of inputs, timestamps, and ground truths.
     """
-    temperature = data["meantemp"].to_list()
-    dates = data["date"].to_list()
+    temperature = data["meantemp"].to_numpy(dtype=np.float64)
+    dates = data["date"].to_numpy()
 
     inputs = [
         temperature[0:200],
@@ -58,8 +67,8 @@ def perform_inference(predictor, inputs, timestamps, horizon=100) -> list:
     Performs inference using the predictor and input data.
 
     :param predictor: A predictor instance for making predictions.
-    :param inputs: A list of input data.
-    :param timestamps: A list of timestamps corresponding to the inputs.
+    :param inputs: A list of input arrays.
+    :param timestamps: A list of timestamp arrays corresponding to the inputs.
     :param horizon: The prediction horizon.
     :return: A list of predictions.
     """
@@ -77,20 +86,41 @@ def perform_inference(predictor, inputs, timestamps, horizon=100) -> list:
     return make_inference(predictor, instances)
 
 
-def save_visualizations(viz, save_dir: str, file_prefix: str = "forecast") -> None:
+def _build_frames(inputs, predictions, ground_truths) -> list:
+    """
+    Builds the padded plotting arrays for each task once, so both figures can share them.
+
+    :param inputs: A list of input arrays.
+    :param predictions: Inference results from the predictor.
+    :param ground_truths: A list of ground-truth arrays.
+    :return: A list of forecast frames, one per task.
+    """
+    return [
+        build_forecast_frame(
+            inputs[task_i],
+            predictions[0][task_i]["point_forecast"],
+            ground_truth=ground_truths[task_i],
+            horizon_lower=predictions[0][task_i]["p30"],
+            horizon_upper=predictions[0][task_i]["p70"],
+        )
+        for task_i in range(len(inputs))
+    ]
+
+
+def save_visualizations(viz, save_dir: str, file_prefix: str = "forecast", close: bool = True, dpi: Optional[int] = None) -> None:
     """
     Saves visualizations to the specified directory.
 
     :param viz: A Visualizer instance containing the plots.
     :param save_dir: Directory where the visualizations will be saved.
     :param file_prefix: Prefix for the saved file names.
+    :param close: Whether to close the figure after saving; pass False to reuse it.
+    :param dpi: Resolution of the saved image; defaults to the Visualizer's own dpi.
     """
-    if not os.path.exists(save_dir):
-        os.makedirs(save_dir)
-        logger.info("Created directory: %s", save_dir)
+    Path(save_dir).mkdir(parents=True, exist_ok=True)
 
     save_path = os.path.join(save_dir, f"{file_prefix}.png")
-    viz.save(save_path)
+    viz.save(save_path, close=close, dpi=dpi)
     logger.info("Visualization saved to: %s", save_path)
 
 
@@ -107,8 +137,8 @@ def test():
     inputs, timestamps, ground_truths = prepare_instances(data)
 
     # 3. Load the endpoint name
-    yaml_file_path = "./config/endpoints.yml"
-    endpoint_name = get_endpoint_name(yaml_file_path)
+    endpoints_file_path = "./config/endpoints.jsonl"
+    endpoint_name = get_endpoint_name(endpoints_file_path)
 
     # 4. Create the Vertex AI Predictor
     predictor = create_vertex_ai_predictor(endpoint_name)
@@ -118,32 +148,30 @@ def test():
     logger.info("Predictions: %s", predictions)
 
     # 6. Visualization
+    frames = _build_frames(inputs, predictions, ground_truths)
     viz = Visualizer(nrows=1, ncols=3)
 
-    for task_i in range(len(inputs)):
-        viz.visualize_forecast(
-            inputs[task_i],
-            predictions[0][task_i]["point_forecast"][:100],
-            ground_truth=ground_truths[task_i],
+    for task_i, frame in enumerate(frames):
+        viz.visualize_frame(
+            frame,
+            with_bounds=False,
+            horizon_len=100,
             title=f"Daily Temperature in Delhi, India, Task {task_i + 1}",
             ylabel="Temperature (°C)",
         )
 
     # 7. Save visualizations
     save_dir = "./data/visuals"
-    save_visualizations(viz, save_dir, file_prefix="temperature_forecasts")
+    save_visualizations(viz, save_dir, file_prefix="temperature_forecasts", close=False)
 
 
-    # Visualize with Quantiles for Anamoly Detection 
-    viz = Visualizer(nrows=1, ncols=3)
+    # Visualize with Quantiles for Anamoly Detection, reusing the same figure
+    viz.reset()
 
-    for task_i in range(len(inputs)):
-        viz.visualize_forecast(
-            inputs[task_i],
-            predictions[0][task_i]["point_forecast"],
-            ground_truth=ground_truths[task_i],
-            horizon_lower=predictions[0][task_i]["p30"],
-            horizon_upper=predictions[0][task_i]["p70"],
+    for task_i, frame in enumerate(frames):
+        viz.visualize_frame(
+            frame,
+            with_bounds=True,
             title=f"Daily Temperature in Delhi, India, Task {task_i + 1}",
             ylabel="Temperature (°C)",
         )
@@ -1,24 +1,33 @@
 from src.invoke.helper import create_vertex_ai_predictor
 from src.invoke.helper import make_inference
 from src.invoke.helper import load_endpoints
+from src.utils.io import read_csv_cached
 from src.config.logging import logger
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
 import pandas as pd
-import json
+import numpy as np
+import orjson
 import os
+import re
 
 
 # https://github.com/google-research/timesfm/blob/master/notebooks/covariates.ipynb
 
-def get_endpoint_name(yaml_file_path: str) -> str:
+# Timestamps already in "YYYY-MM-DD HH:MM:SS" (or ISO 8601) form only need their separator swapped
+_ISO_LIKE_TIMESTAMP = re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}")
+
+
+def get_endpoint_name(endpoints_file_path: str) -> str:
     """
-    Loads endpoints from the given YAML configuration and returns the first one.
+    Loads endpoints from the given configuration file and returns the first one.
     
-    :param yaml_file_path: Path to the YAML file containing endpoints.
+    :param endpoints_file_path: Path to the file containing endpoints.
     :return: The name of the first endpoint found.
     :raises ValueError: If no endpoints are found.
     """
-    endpoints = load_endpoints(yaml_file_path)
+    endpoints = load_endpoints(endpoints_file_path)
     if not endpoints:
         logger.error("No endpoints found in the configuration file.")
         raise ValueError("Endpoints configuration is empty.")
@@ -34,12 +43,18 @@ def load_electricity_data(file_path: str) -> pd.DataFrame:
     :return: A Pandas DataFrame with the loaded data.
     :raises FileNotFoundError: If the file does not exist.
     """
-    if not os.path.exists(file_path):
-        logger.error("Electricity data file not found: %s", file_path)
-        raise FileNotFoundError(f"File not found: {file_path}")
-
     logger.info("Loading electricity data from: %s", file_path)
-    return pd.read_csv(file_path)
+    try:
+        # y and gen_forecast stay float64 since they are sent to the endpoint; float32 values
+        # would widen to noisy digits on the wire (53.48 -> 53.47999954223633)
+        return read_csv_cached(
+            file_path,
+            usecols=["unique_id", "ds", "y", "gen_forecast", "week_day"],
+            dtype={"unique_id": "category", "y": "float64", "gen_forecast": "float64", "week_day": "int8"},
+        )
+    except FileNotFoundError:
+        logger.error("Electricity data file not found: %s", file_path)
+        raise
 
 
 def get_batched_data_fn(data: pd.DataFrame, batch_size: int = 128, context_len: int = 120, horizon_len: int = 24):
@@ -52,92 +67,175 @@ def get_batched_data_fn(data: pd.DataFrame, batch_size: int = 128, context_len:
     :param horizon_len: Length of the forecasting horizon.
     :return: A generator function yielding batches of data.
     """
-    examples = defaultdict(list)
+    window_len = context_len + horizon_len
+    columns = ["y", "gen_forecast", "week_day", "ds"]
+
+    # First pass: extract each group's columns once and count its forecasting windows
+    groups = []
     num_examples = 0
+    for country, sub_df in data.groupby("unique_id", sort=False, observed=True):
+        arrays = {col: sub_df[col].to_numpy() for col in columns}
+        starts = range(0, len(sub_df) - window_len, horizon_len)
+        groups.append((country, arrays, starts))
+        num_examples += len(starts)
 
-    for country in data["unique_id"].unique():
-        sub_df = data[data["unique_id"] == country]
-        for start in range(0, len(sub_df) - (context_len + horizon_len), horizon_len):
-            num_examples += 1
-            examples["country"].append(country)
-            examples["inputs"].append(
-                sub_df["y"][start:(context_end := start + context_len)].tolist()
-            )
-            examples["gen_forecast"].append(
-                sub_df["gen_forecast"][start:context_end + horizon_len].tolist()
-            )
-            examples["week_day"].append(
-                sub_df["week_day"][start:context_end + horizon_len].tolist()
-            )
-            examples["timestamps"].append(
-                sub_df["ds"][start:context_end].tolist()  # Use `ds` for timestamps
-            )
-            examples["outputs"].append(
-                sub_df["y"][context_end:(context_end + horizon_len)].tolist()
-            )
+    # Preallocate contiguous example arrays, one row per window
+    dtypes = {col: data[col].iloc[:0].to_numpy().dtype for col in columns}
+    examples = {
+        "country": np.empty(num_examples, dtype=object),
+        "inputs": np.empty((num_examples, context_len), dtype=dtypes["y"]),
+        "gen_forecast": np.empty((num_examples, window_len), dtype=dtypes["gen_forecast"]),
+        "week_day": np.empty((num_examples, window_len), dtype=dtypes["week_day"]),
+        "timestamps": np.empty((num_examples, context_len), dtype=dtypes["ds"]),  # Use `ds` for timestamps
+        "outputs": np.empty((num_examples, horizon_len), dtype=dtypes["y"]),
+    }
+
+    # Second pass: fill the rows with slice assignment
+    row = 0
+    for country, arrays, starts in groups:
+        for start in starts:
+            context_end = start + context_len
+            examples["country"][row] = country
+            examples["inputs"][row] = arrays["y"][start:context_end]
+            examples["gen_forecast"][row] = arrays["gen_forecast"][start:context_end + horizon_len]
+            examples["week_day"][row] = arrays["week_day"][start:context_end + horizon_len]
+            examples["timestamps"][row] = arrays["ds"][start:context_end]
+            examples["outputs"][row] = arrays["y"][context_end:context_end + horizon_len]
+            row += 1
 
     def data_fn():
+        # Lists are only materialized for the batch being yielded
         for i in range(1 + (num_examples - 1) // batch_size):
-            yield {k: v[(i * batch_size):((i + 1) * batch_size)] for k, v in examples.items()}
+            yield {k: v[(i * batch_size):((i + 1) * batch_size)].tolist() for k, v in examples.items()}
 
     return data_fn
 
 
-def perform_forecast_with_and_without_covariates(predictor, data_fn, output_dir, context_len, horizon_len):
+def _json_default(obj: Any) -> Any:
+    """
+    Fallback serializer for types orjson does not handle natively.
+
+    :param obj: The object orjson could not serialize.
+    :return: A JSON-serializable representation of the object.
+    :raises TypeError: If the object type is not supported.
+    """
+    # Vertex AI returns a `Prediction` NamedTuple, which stdlib json wrote as a list
+    if isinstance(obj, tuple):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_json(file_path: str, obj: Any) -> None:
+    """
+    Serializes an object to an indented JSON file using orjson.
+
+    :param file_path: Path of the JSON file to write.
+    :param obj: The object to serialize; NumPy arrays are serialized natively.
+    """
+    with open(file_path, "wb") as f:
+        f.write(orjson.dumps(obj, default=_json_default, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+
+
+def _to_iso_timestamps(timestamp_lists: list) -> list:
+    """
+    Converts lists of timestamps to ISO 8601 strings, preserving the list structure.
+
+    Strings already in "YYYY-MM-DD HH:MM:SS" form are passed through with a "T" separator,
+    based on a sample of the first timestamp; anything else goes through pandas.
+
+    :param timestamp_lists: A list of timestamp lists.
+    :return: A list of lists of ISO 8601 formatted timestamps.
+    """
+    if not timestamp_lists:
+        return []
+
+    sample = next((timestamp_list[0] for timestamp_list in timestamp_lists if len(timestamp_list)), None)
+    if isinstance(sample, str) and _ISO_LIKE_TIMESTAMP.fullmatch(sample):
+        return [[ts.replace(" ", "T", 1) for ts in timestamp_list] for timestamp_list in timestamp_lists]
+
+    bounds = np.cumsum([0] + [len(timestamp_list) for timestamp_list in timestamp_lists])
+    flat = np.concatenate([np.asarray(timestamp_list) for timestamp_list in timestamp_lists])
+    iso_flat = pd.to_datetime(flat).strftime("%Y-%m-%dT%H:%M:%S").to_numpy()
+    return [iso_flat[start:end].tolist() for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+def _forecast_batch(executor, predictor, example, batch_index, output_dir, horizon_len) -> list:
+    """
+    Runs both forecasts for a single batch and schedules their JSON writes.
+
+    :param executor: Executor used for the inference requests and file writes.
+    :param predictor: Vertex AI predictor instance.
+    :param example: A batch of examples produced by the data generator.
+    :param batch_index: Zero-based index of the batch.
+    :param output_dir: Directory to save the forecast results.
+    :param horizon_len: Length of the forecasting horizon.
+    :return: Futures of the scheduled JSON writes.
+    """
+    # Convert timestamps in `ds` to ISO 8601 format in one vectorized pass
+    iso_timestamps = _to_iso_timestamps(example["timestamps"])
+
+    # Prepare inference payloads
+    payload_without_covariates = [
+        {
+            "input": example["inputs"][j],
+            "horizon": horizon_len,
+            "timestamp": iso_timestamps[j],
+        }
+        for j in range(len(example["inputs"]))
+    ]
+
+    payload_with_covariates = [
+        {
+            "input": example["inputs"][j],
+            "horizon": horizon_len,
+            "timestamp": iso_timestamps[j],
+            "dynamic_numerical_covariates": {"gen_forecast": example["gen_forecast"][j]},
+            "dynamic_categorical_covariates": {"week_day": example["week_day"][j]},
+            "static_categorical_covariates": {"country": example["country"][j]},
+        }
+        for j in range(len(example["inputs"]))
+    ]
+
+    # Make predictions concurrently
+    raw_future = executor.submit(make_inference, predictor, payload_without_covariates)
+    cov_future = executor.submit(make_inference, predictor, payload_with_covariates)
+
+    # Save forecasts to JSON files in the background
+    raw_forecast_file = os.path.join(output_dir, f"raw_forecast_batch_{batch_index + 1}.json")
+    cov_forecast_file = os.path.join(output_dir, f"cov_forecast_batch_{batch_index + 1}.json")
+
+    return [
+        executor.submit(_write_json, raw_forecast_file, raw_future.result()),
+        executor.submit(_write_json, cov_forecast_file, cov_future.result()),
+    ]
+
+
+def perform_forecast_with_and_without_covariates(predictor, data_fn, output_dir, context_len, horizon_len, max_workers: int = 4):
     """
     Performs forecasting with and without covariates and saves the results to JSON files.
 
+    The two inference requests of each batch are issued concurrently, and each batch's
+    JSON writes overlap with the next batch's inference requests.
+
     :param predictor: Vertex AI predictor instance.
     :param data_fn: Batched data generator.
     :param output_dir: Directory to save the forecast results.
     :param context_len: Length of the forecasting context.
     :param horizon_len: Length of the forecasting horizon.
+    :param max_workers: Number of threads used for inference requests and file writes.
     """
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-
-    for i, example in enumerate(data_fn()):
-        # Convert timestamps in `ds` to ISO 8601 format
-        iso_timestamps = [
-            [pd.Timestamp(ts).isoformat() for ts in timestamp_list]
-            for timestamp_list in example["timestamps"]
-        ]
-
-        # Prepare inference payloads
-        payload_without_covariates = [
-            {
-                "input": example["inputs"][j],
-                "horizon": horizon_len,
-                "timestamp": iso_timestamps[j],
-            }
-            for j in range(len(example["inputs"]))
-        ]
-
-        payload_with_covariates = [
-            {
-                "input": example["inputs"][j],
-                "horizon": horizon_len,
-                "timestamp": iso_timestamps[j],
-                "dynamic_numerical_covariates": {"gen_forecast": example["gen_forecast"][j]},
-                "dynamic_categorical_covariates": {"week_day": example["week_day"][j]},
-                "static_categorical_covariates": {"country": example["country"][j]},
-            }
-            for j in range(len(example["inputs"]))
-        ]
-
-        # Make predictions
-        raw_forecast = make_inference(predictor, payload_without_covariates)
-        cov_forecast = make_inference(predictor, payload_with_covariates)
-
-        # Save forecasts to JSON files
-        raw_forecast_file = os.path.join(output_dir, f"raw_forecast_batch_{i + 1}.json")
-        cov_forecast_file = os.path.join(output_dir, f"cov_forecast_batch_{i + 1}.json")
-
-        with open(raw_forecast_file, "w") as raw_file:
-            json.dump(raw_forecast, raw_file, indent=4)
-
-        with open(cov_forecast_file, "w") as cov_file:
-            json.dump(cov_forecast, cov_file, indent=4)
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        write_futures = []
+        for i, example in enumerate(data_fn()):
+            write_futures.extend(
+                _forecast_batch(executor, predictor, example, i, output_dir, horizon_len)
+            )
+
+        # Surface any write errors
+        for future in write_futures:
+            future.result()
 
 
 def test():
@@ -156,8 +254,8 @@ def test():
     data_fn = get_batched_data_fn(data, batch_size, context_len, horizon_len)
 
     # 3. Initialize Vertex AI Predictor
-    yaml_file_path = "./config/endpoints.yml"
-    endpoint_name = get_endpoint_name(yaml_file_path)
+    endpoints_file_path = "./config/endpoints.jsonl"
+    endpoint_name = get_endpoint_name(endpoints_file_path)
     predictor = create_vertex_ai_predictor(endpoint_name)
 
     # 4. Perform forecasting with and without covariates
@@ -1,8 +1,8 @@
 from src.config.logging import logger 
+from src.utils.io import read_csv_cached
 from collections import defaultdict
-import matplotlib.pyplot as plt
+from pathlib import Path
 import pandas as pd
-import seaborn as sns
 import os
 
 
@@ -14,12 +14,12 @@ def load_electricity_data(file_path: str) -> pd.DataFrame:
     :return: A Pandas DataFrame with the loaded data.
     :raises FileNotFoundError: If the file does not exist.
     """
-    if not os.path.exists(file_path):
-        logger.error("Electricity data file not found: %s", file_path)
-        raise FileNotFoundError(f"File not found: {file_path}")
-
     logger.info("Loading electricity data from: %s", file_path)
-    return pd.read_csv(file_path)
+    try:
+        return read_csv_cached(file_path, usecols=["ds", "y"], dtype={"y": "float32"})
+    except FileNotFoundError:
+        logger.error("Electricity data file not found: %s", file_path)
+        raise
 
 
 def visualize_first_batch(df, batch_size=128, context_len=5, horizon_len=2, output_dir='./data/visuals'):
@@ -33,6 +33,10 @@ def visualize_first_batch(df, batch_size=128, context_len=5, horizon_len=2, outp
         horizon_len (int): Length of the forecast horizon.
         output_dir (str): Directory to save the visualizations.
     """
+    # Plotting libraries are imported lazily to keep module import cheap
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     # Prepare the examples
     examples = defaultdict(list)
     num_examples = 0
@@ -63,7 +67,7 @@ def visualize_first_batch(df, batch_size=128, context_len=5, horizon_len=2, outp
     batch_df["timestamp"] = pd.to_datetime(batch_df["timestamp"])
 
     # Ensure output directory exists
-    os.makedirs(output_dir, exist_ok=True)
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
 
     # Visualize the first batch
     plt.figure(figsize=(14, 7))
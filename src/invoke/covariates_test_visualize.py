@@ -1,8 +1,7 @@
-import matplotlib.pyplot as plt
-import seaborn as sns
 import pandas as pd
+import numpy as np
+import orjson
 import os
-import json
 
 
 def load_forecast_json(file_path):
@@ -16,16 +15,23 @@ def load_forecast_json(file_path):
         pd.DataFrame: Processed DataFrame with forecast data.
     """
     try:
-        with open(file_path, 'r') as file:
-            data = json.load(file)
+        with open(file_path, 'rb') as file:
+            data = orjson.loads(file.read())
 
-        # Flatten nested JSON if necessary
-        rows = []
-        for entry in data[0]:
-            for timestamp, forecast in zip(entry['timestamp'], entry['point_forecast']):
-                rows.append({'timestamp': timestamp, 'forecast': forecast})
+        # Flatten nested JSON column-wise, pairing timestamps and forecasts per entry
+        sized_entries = [
+            (entry, n) for entry in data[0]
+            if (n := min(len(entry['timestamp']), len(entry['point_forecast'])))
+        ]
+        if not sized_entries:
+            return pd.DataFrame()
 
-        return pd.DataFrame(rows)
+        timestamps = np.concatenate([np.asarray(entry['timestamp'][:n]) for entry, n in sized_entries])
+        forecasts = np.concatenate([
+            np.asarray(entry['point_forecast'][:n], dtype=np.float32) for entry, n in sized_entries
+        ])
+
+        return pd.DataFrame({'timestamp': timestamps, 'forecast': forecasts})
 
     except Exception as e:
         print(f"Error loading JSON file {file_path}: {e}")
@@ -41,6 +47,10 @@ def visualize_forecasts_from_json(file_with_cov, file_without_cov, output_dir='.
         file_without_cov (str): Path to the JSON file containing forecasts without covariates.
         output_dir (str): Directory to save the visualizations.
     """
+    # Plotting libraries are imported lazily to keep module import cheap
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     # Load the data
     df_with_cov = load_forecast_json(file_with_cov)
     df_without_cov = load_forecast_json(file_without_cov)
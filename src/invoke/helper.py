@@ -1,38 +1,109 @@
 from google.cloud.aiplatform.prediction.predictor import Predictor
+from google.auth.transport.requests import AuthorizedSession
+from google.auth.credentials import with_scopes_if_required
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from src.config.logging import logger
 from google.cloud import aiplatform
-import matplotlib.pyplot as plt
 from src.config.setup import * 
 from typing import Optional
 from typing import List
 from typing import Dict 
 from typing import Any 
 import numpy as np
+import functools
+import asyncio
+import orjson
 import yaml 
+import os
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Connection pool size for HTTP requests made through an endpoint's authorized session.
+HTTP_POOL_SIZE = 32
+CLOUD_PLATFORM_SCOPES = ["https://www.googleapis.com/auth/cloud-platform"]
 
 
 def load_endpoints(file_path: str) -> List[str]:
     """
-    Load endpoints from a YAML configuration file.
+    Load endpoints from a JSON Lines file (one {"endpoint": ...} object per line)
+    or, for files not ending in `.jsonl`, a YAML file with an `endpoints` list.
+
+    Parsed results are cached per process and invalidated when the file's
+    modification time changes. Each call returns a fresh list, so callers may
+    mutate it without affecting the cache.
     
     Args:
-        file_path (str): Path to the YAML file.
+        file_path (str): Path to the endpoints file.
         
     Returns:
         List[str]: A list of endpoint resource names.
     """
     try:
+        mtime_ns = os.stat(file_path).st_mtime_ns
+    except Exception as e:
+        logger.error("Failed to load endpoints from %s: %s", file_path, e)
+        raise
+    # Key on the absolute path so relative and absolute spellings share one cache entry
+    return list(_load_endpoints_cached(os.path.abspath(file_path), mtime_ns))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_endpoints_cached(file_path: str, mtime_ns: int) -> tuple:
+    """
+    Parse the endpoints file; cached on the file path and modification time.
+
+    Args:
+        file_path (str): Path to the JSON Lines or YAML file.
+        mtime_ns (int): Modification time of the file in nanoseconds, used only as part of the cache key.
+
+    Returns:
+        tuple: The endpoint resource names.
+    """
+    try:
+        if file_path.endswith(".jsonl"):
+            with open(file_path, "rb") as f:
+                return tuple(orjson.loads(line)["endpoint"] for line in f if line.strip())
         with open(file_path, "r") as f:
-            data = yaml.safe_load(f)
-        return data.get("endpoints", [])
+            data = yaml.load(f, Loader=SafeLoader)
+        return tuple(data.get("endpoints", []))
     except Exception as e:
         logger.error("Failed to load endpoints from %s: %s", file_path, e)
         raise
 
 
+def _create_authorized_session(credentials) -> AuthorizedSession:
+    """
+    Create an authorized HTTP session with a pooled, retrying connection adapter.
+
+    Args:
+        credentials: Google credentials used to authorize requests.
+
+    Returns:
+        AuthorizedSession: Session that reuses TLS connections across requests.
+    """
+    session = AuthorizedSession(with_scopes_if_required(credentials, CLOUD_PLATFORM_SCOPES))
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+@functools.lru_cache(maxsize=8)
 def create_vertex_ai_predictor(endpoint_name: str) -> Predictor:
     """
     Create a Vertex AI predictor for the given endpoint.
+
+    Predictors are memoized per endpoint name, so repeated calls skip endpoint
+    discovery and credential resolution. Standard predict calls go over the
+    client's gRPC channel, which is reused together with the predictor; HTTP
+    calls (dedicated endpoints, raw predict) use a pooled authorized session.
     
     Args:
         endpoint_name (str): The fully qualified endpoint resource name.
@@ -42,6 +113,7 @@ def create_vertex_ai_predictor(endpoint_name: str) -> Predictor:
     """
     try:
         predictor = aiplatform.Endpoint(endpoint_name=endpoint_name)
+        predictor.authorized_session = _create_authorized_session(predictor.credentials)
         logger.info("Successfully created Vertex AI Predictor for endpoint: %s", endpoint_name)
         return predictor
     except Exception as e:
@@ -49,9 +121,35 @@ def create_vertex_ai_predictor(endpoint_name: str) -> Predictor:
         raise
 
 
+def _preserialize(value: Any) -> Any:
+    """
+    Convert NumPy arrays and scalars nested in prediction instances to native Python types.
+
+    Lists and tuples are walked element by element, so lists of NumPy scalars (e.g.
+    `list(ndarray)`) and lists mixing scalars with arrays are converted too.
+
+    Args:
+        value (Any): An instance list, instance dict, or field value.
+
+    Returns:
+        Any: The value with NumPy data converted in a single C-level pass per array.
+    """
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    if isinstance(value, dict):
+        return {k: _preserialize(v) for k, v in value.items()}
+    # Every element is visited: lists may mix native values with NumPy scalars or arrays
+    if isinstance(value, (list, tuple)):
+        return [_preserialize(v) for v in value]
+    return value
+
+
 def make_inference(predictor: Predictor, instances: List[Dict[str, Any]]) -> Any:
     """
     Make inference using the Vertex AI endpoint.
+
+    Instance fields may be NumPy arrays; they are converted to native Python
+    types only here, at the transport boundary.
     
     Args:
         predictor (Predictor): The Vertex AI Predictor instance.
@@ -61,7 +159,7 @@ def make_inference(predictor: Predictor, instances: List[Dict[str, Any]]) -> Any
         Any: Prediction results.
     """
     try:
-        results = predictor.predict(instances=instances)
+        results = predictor.predict(instances=_preserialize(instances))
         logger.info("Inference completed successfully.")
         return results
     except Exception as e:
@@ -69,16 +167,104 @@ def make_inference(predictor: Predictor, instances: List[Dict[str, Any]]) -> Any
         raise
 
 
+def build_forecast_frame(
+    context: List[float],
+    horizon_mean: List[float],
+    ground_truth: Optional[List[float]] = None,
+    horizon_lower: Optional[List[float]] = None,
+    horizon_upper: Optional[List[float]] = None,
+) -> Dict[str, Any]:
+    """
+    Build the NaN-padded series needed to plot a forecast against its context.
+
+    All series share one x-axis spanning the context followed by the forecast horizon.
+
+    Args:
+        context (List[float]): Historical context values.
+        horizon_mean (List[float]): Forecasted mean values.
+        ground_truth (Optional[List[float]]): Actual values (if available).
+        horizon_lower (Optional[List[float]]): Lower bound of forecast (if available).
+        horizon_upper (Optional[List[float]]): Upper bound of forecast (if available).
+
+    Returns:
+        Dict[str, Any]: Arrays keyed by "x", "ctx", "fc", "gt", "lo" and "hi" (None when
+        not available), plus the context length under "n_ctx".
+    """
+    n_ctx = len(context)
+    n_h = len(horizon_mean)
+    total = n_ctx + n_h
+
+    def pad_horizon(values) -> Optional[np.ndarray]:
+        if values is None or not len(values):
+            return None
+        padded = np.full(total, np.nan)
+        values = np.asarray(values, dtype=float)[:n_h]
+        padded[n_ctx:n_ctx + len(values)] = values
+        return padded
+
+    ctx_arr = np.full(total, np.nan)
+    ctx_arr[:n_ctx] = context
+
+    lower_arr = pad_horizon(horizon_lower)
+    upper_arr = pad_horizon(horizon_upper)
+    if lower_arr is None or upper_arr is None:
+        lower_arr = upper_arr = None
+
+    return {
+        "n_ctx": n_ctx,
+        "x": np.arange(total),
+        "ctx": ctx_arr,
+        "fc": pad_horizon(horizon_mean),
+        "gt": pad_horizon(ground_truth),
+        "lo": lower_arr,
+        "hi": upper_arr,
+    }
+
+
+async def apredict(predictor: Predictor, instances: List[Dict[str, Any]], semaphore: Optional[asyncio.Semaphore] = None) -> Any:
+    """
+    Asynchronously make inference using the Vertex AI endpoint.
+
+    The blocking predict call runs in a worker thread, so several requests can be
+    awaited concurrently (e.g. with `asyncio.gather`).
+
+    Args:
+        predictor (Predictor): The Vertex AI Predictor instance.
+        instances (List[Dict[str, Any]]): List of input instances for prediction.
+        semaphore (Optional[asyncio.Semaphore]): Limits the number of in-flight requests.
+
+    Returns:
+        Any: Prediction results.
+    """
+    if semaphore is None:
+        return await asyncio.to_thread(make_inference, predictor, instances)
+    async with semaphore:
+        return await asyncio.to_thread(make_inference, predictor, instances)
+
+
 class Visualizer:
-    def __init__(self, nrows: int, ncols: int):
+    def __init__(self, nrows: int, ncols: int, dpi: int = 100, publication: bool = False):
         """
         Initialize the Visualizer with a grid of subplots.
 
         Args:
             nrows (int): Number of rows of subplots.
             ncols (int): Number of columns of subplots.
+            dpi (int): Resolution used when saving the figure.
+            publication (bool): Save at 300 dpi for publication-quality output,
+                overriding `dpi` here and in `save`.
         """
+        # Imported lazily so scripts that never plot skip matplotlib's startup cost;
+        # the non-interactive Agg backend avoids GUI backend detection
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
+        plt.rcParams["figure.max_open_warning"] = 0
+
         self.ncols = ncols
+        self.publication = publication
+        self.dpi = 300 if publication else dpi
         self.num_images = nrows * ncols
         self.fig, self.axes = plt.subplots(
             nrows, ncols, figsize=(ncols * 4, nrows * 2.5)
@@ -92,6 +278,14 @@ class Visualizer:
 
         self.index = 0
 
+    def reset(self) -> None:
+        """
+        Clear all subplots so the figure can be reused for another set of visualizations.
+        """
+        for ax in self.axes:
+            ax.clear()
+        self.index = 0
+
     def visualize_forecast(
         self,
         context: List[float],
@@ -105,6 +299,8 @@ class Visualizer:
         """
         Visualize the forecast on a subplot.
 
+        Lists and NumPy arrays are both accepted for the series arguments.
+
         Args:
             context (List[float]): Historical context values.
             horizon_mean (List[float]): Forecasted mean values.
@@ -114,79 +310,83 @@ class Visualizer:
             ylabel (Optional[str]): Label for the y-axis.
             title (Optional[str]): Title for the subplot.
         """
+        frame = build_forecast_frame(context, horizon_mean, ground_truth, horizon_lower, horizon_upper)
+        self.visualize_frame(frame, ylabel=ylabel, title=title)
+
+    def visualize_frame(
+        self,
+        frame: Dict[str, Any],
+        with_bounds: bool = True,
+        horizon_len: Optional[int] = None,
+        ylabel: Optional[str] = None,
+        title: Optional[str] = None,
+    ) -> None:
+        """
+        Visualize a prebuilt forecast frame on a subplot.
+
+        The same frame can be drawn into several Visualizers without rebuilding its arrays.
+
+        Args:
+            frame (Dict[str, Any]): Padded series produced by `build_forecast_frame`.
+            with_bounds (bool): Whether to draw the forecast bounds (if available).
+            horizon_len (Optional[int]): Number of forecast steps to draw; defaults to all.
+            ylabel (Optional[str]): Label for the y-axis.
+            title (Optional[str]): Title for the subplot.
+        """
         if self.index >= len(self.axes):
             raise ValueError("More visualizations requested than available subplots.")
 
-        # Prepare x-axis range
-        plt_range = list(range(len(context) + len(horizon_mean)))
+        end = len(frame["x"]) if horizon_len is None else frame["n_ctx"] + horizon_len
+        x = frame["x"][:end]
+        ax = self.axes[self.index]
 
         # Plot context
-        self.axes[self.index].plot(
-            plt_range,
-            context + [np.nan] * len(horizon_mean),
-            color="tab:cyan",
-            label="Context",
-        )
+        ax.plot(x, frame["ctx"][:end], color="tab:cyan", label="Context")
 
         # Plot forecast
-        self.axes[self.index].plot(
-            plt_range,
-            [np.nan] * len(context) + horizon_mean,
-            color="tab:red",
-            label="Forecast",
-        )
+        ax.plot(x, frame["fc"][:end], color="tab:red", label="Forecast")
 
         # Plot ground truth if available
-        if ground_truth:
-            self.axes[self.index].plot(
-                plt_range,
-                [np.nan] * len(context) + ground_truth,
-                color="tab:purple",
-                label="Ground Truth",
-            )
+        if frame["gt"] is not None:
+            ax.plot(x, frame["gt"][:end], color="tab:purple", label="Ground Truth")
 
         # Plot forecast bounds if available
-        if horizon_upper and horizon_lower:
-            self.axes[self.index].plot(
-                plt_range,
-                [np.nan] * len(context) + horizon_upper,
-                color="tab:orange",
-                linestyle="--",
-                label="Forecast Upper",
-            )
-            self.axes[self.index].plot(
-                plt_range,
-                [np.nan] * len(context) + horizon_lower,
-                color="tab:orange",
-                linestyle=":",
-                label="Forecast Lower",
-            )
-            self.axes[self.index].fill_between(
-                plt_range,
-                [np.nan] * len(context) + horizon_upper,
-                [np.nan] * len(context) + horizon_lower,
-                color="tab:orange",
-                alpha=0.2,
-            )
+        if with_bounds and frame["hi"] is not None and frame["lo"] is not None:
+            upper_arr = frame["hi"][:end]
+            lower_arr = frame["lo"][:end]
+            ax.plot(x, upper_arr, color="tab:orange", linestyle="--", label="Forecast Upper")
+            ax.plot(x, lower_arr, color="tab:orange", linestyle=":", label="Forecast Lower")
+            ax.fill_between(x, upper_arr, lower_arr, color="tab:orange", alpha=0.2)
 
         # Add labels and title
         if ylabel:
-            self.axes[self.index].set_ylabel(ylabel)
+            ax.set_ylabel(ylabel)
         if title:
-            self.axes[self.index].set_title(title)
+            ax.set_title(title)
 
         # Finalize subplot
-        self.axes[self.index].set_xlabel("Time")
-        self.axes[self.index].legend()
+        ax.set_xlabel("Time")
+        ax.legend()
         self.index += 1
 
-    def save(self, path: str) -> None:
+    def save(self, path: str, close: bool = True, dpi: Optional[int] = None) -> None:
         """
         Save all subplots to a file.
 
+        PNG output favours encoding speed over file size.
+
         Args:
             path (str): Path to save the figure.
+            close (bool): Whether to close the figure after saving. Pass False to
+                `reset` and reuse the figure afterwards.
+            dpi (Optional[int]): Resolution override; defaults to the Visualizer's dpi.
+                Ignored when the Visualizer was created with `publication=True`.
         """
+        import matplotlib.pyplot as plt
+
         self.fig.tight_layout()
-        self.fig.savefig(path, dpi=300)
-        plt.close(self.fig)
\ No newline at end of file
+        if self.publication or dpi is None:
+            dpi = self.dpi
+        self.fig.savefig(path, dpi=dpi, pil_kwargs={"compress_level": 1})
+        if close:
+            plt.close(self.fig)
\ No newline at end of file
@@ -1,40 +1,30 @@
 
 from src.invoke.helper import create_vertex_ai_predictor
+from src.utils.inference import get_endpoint_name
 from src.invoke.helper import make_inference
-from src.invoke.helper import load_endpoints
 from src.invoke.helper import Visualizer
 from src.config.logging import logger
 from src.config.setup import * 
 import numpy as np
 
 
-def get_endpoint_name(yaml_file_path: str) -> str:
-    """
-    Loads endpoints from the given YAML configuration and returns the first one.
-    
-    :param yaml_file_path: Path to the YAML file containing endpoints.
-    :return: The name of the first endpoint found.
-    :raises ValueError: If no endpoints are found.
-    """
-    endpoints = load_endpoints(yaml_file_path)
-    if not endpoints:
-        logger.error("No endpoints found in the configuration file.")
-        raise ValueError("Endpoints configuration is empty.")
-    logger.info("Using endpoint: %s", endpoints[0])
-    return endpoints[0]
+# Example data: two sine waves of different frequencies, computed once at import
+_INSTANCES = [
+    {"input": np.sin(np.linspace(0, 20, 100)).tolist()},
+    {"input": np.sin(np.linspace(0, 40, 500)).tolist()},
+]
 
 
 def get_instances() -> list:
     """
     Prepares a list of instances to be sent for prediction.
+
+    Both series are sent together in a single prediction request. The instances are
+    precomputed and shared between calls, so callers must not mutate them.
     
     :return: A list of dictionaries containing the input data.
     """
-    # Example data: two sine waves of different frequencies
-    return [
-        {"input": np.sin(np.linspace(0, 20, 100)).tolist()},
-        {"input": np.sin(np.linspace(0, 40, 500)).tolist()},
-    ]
+    return _INSTANCES
 
 
 def test():
@@ -43,8 +33,8 @@ def test():
     performs inference, and visualizes the results.
     """
     # 1. Load the endpoint name
-    yaml_file_path = "./config/endpoints.yml"
-    endpoint_name = get_endpoint_name(yaml_file_path)
+    endpoints_file_path = "./config/endpoints.jsonl"
+    endpoint_name = get_endpoint_name(endpoints_file_path)
 
     # 2. Create the Vertex AI Predictor
     predictor = create_vertex_ai_predictor(endpoint_name)
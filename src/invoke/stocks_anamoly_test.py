@@ -1,24 +1,43 @@
 from src.invoke.helper import create_vertex_ai_predictor
 from src.invoke.helper import make_inference
+from src.invoke.helper import apredict
 from src.invoke.helper import load_endpoints
 from src.config.logging import logger
+from concurrent.futures import ThreadPoolExecutor
+import matplotlib
+matplotlib.use("Agg")  # Non-interactive backend; figures are only written to disk
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba
+from matplotlib.patches import Patch
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
-from datetime import timedelta
 from datetime import datetime
+from itertools import islice
 from typing import Tuple
 from typing import List
 import pandas as pd
-import json
+import numpy as np
+import asyncio
+import orjson
 import os
 
+# Maximum number of prediction requests in flight at once.
+MAX_CONCURRENT_REQUESTS = 8
 
-def get_endpoint_name(yaml_file_path: str) -> str:
+# Default exchange timezone for the quotes (Nvidia trades on NASDAQ); their UTC offset changes with daylight saving time.
+EXCHANGE_TZ = "America/New_York"
+
+# Figure and axes reused across plots so the canvas and renderer are allocated once.
+_FIG = None
+_AX = None
+
+
+def get_endpoint_name(endpoints_file_path: str) -> str:
     """
-    Retrieve the first endpoint name from a YAML configuration file.
+    Retrieve the first endpoint name from an endpoints configuration file.
 
     Args:
-        yaml_file_path (str): Path to the YAML file containing endpoints.
+        endpoints_file_path (str): Path to the file containing endpoints.
 
     Returns:
         str: The name of the first endpoint.
@@ -26,7 +45,7 @@ def get_endpoint_name(yaml_file_path: str) -> str:
     Raises:
         ValueError: If no endpoints are found in the configuration file.
     """
-    endpoints = load_endpoints(yaml_file_path)
+    endpoints = load_endpoints(endpoints_file_path)
     if not endpoints:
         logger.error("No endpoints found in the configuration file.")
         raise ValueError("Endpoints configuration is empty.")
@@ -38,11 +57,14 @@ def load_stock_data(file_path: str) -> pd.DataFrame:
     """
     Load stock data from a JSON file into a Pandas DataFrame.
 
+    Only the price and date fields used downstream are kept, and the DataFrame is
+    built column-wise rather than from a list of records.
+
     Args:
         file_path (str): Path to the JSON file containing stock data.
 
     Returns:
-        pd.DataFrame: DataFrame containing the stock data.
+        pd.DataFrame: DataFrame containing the stock 'price' and 'date' columns.
 
     Raises:
         FileNotFoundError: If the specified file does not exist.
@@ -52,28 +74,36 @@ def load_stock_data(file_path: str) -> pd.DataFrame:
         raise FileNotFoundError(f"File not found: {file_path}")
 
     logger.info("Loading stock data from: %s", file_path)
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-    return pd.DataFrame(data)
+    with open(file_path, 'rb') as f:
+        data = orjson.loads(f.read())
+    return pd.DataFrame({
+        "price": [record["price"] for record in data],
+        "date": [record["date"] for record in data],
+    })
 
 
-def convert_timestamps(data: pd.DataFrame) -> pd.DataFrame:
+def convert_timestamps(data: pd.DataFrame, tz: str = EXCHANGE_TZ) -> pd.DataFrame:
     """
-    Convert timestamp strings in the DataFrame to Python datetime objects.
+    Convert timestamp strings in the DataFrame to a timezone-aware datetime64 column.
+
+    Parsing is vectorized with an explicit format, and repeated strings are parsed only once.
+    Timestamps are normalized to `tz`, so series spanning a daylight saving change (mixed UTC
+    offsets) still yield a single-timezone column with the local dates intact.
 
     Args:
         data (pd.DataFrame): DataFrame containing a 'date' column with timestamp strings.
+        tz (str): Timezone of the exchange the quotes come from; defaults to EXCHANGE_TZ.
 
     Returns:
-        pd.DataFrame: Updated DataFrame with 'date' column converted to datetime.
+        pd.DataFrame: Updated DataFrame with 'date' converted to datetime64 in timezone `tz`.
 
     Raises:
         ValueError: If timestamp conversion fails due to incorrect format.
     """
     fmt_str = "%b %d %Y, %I:%M %p UTC%z"
     try:
-        data["date"] = data["date"].apply(lambda x: datetime.strptime(x, fmt_str))
-        logger.info("Converted timestamps to datetime objects.")
+        data["date"] = pd.to_datetime(data["date"], format=fmt_str, utc=True, cache=True).dt.tz_convert(tz)
+        logger.info("Converted timestamps to datetime objects in %s.", tz)
     except ValueError as e:
         logger.error("Timestamp conversion failed: %s", e)
         raise ValueError("Invalid timestamp format.") from e
@@ -98,34 +128,155 @@ def prepare_stock_instances(data: pd.DataFrame) -> Tuple[List[List[float]], List
     return [prices], [dates]
 
 
-def perform_inference(predictor, inputs: List[List[float]], timestamps: List[List[datetime]], horizon: int = 21) -> list:
+def format_dates(timestamps: List[datetime]) -> List[str]:
+    """
+    Format datetimes as YYYY-MM-DD strings in their own (local) timezone.
+
+    Args:
+        timestamps (List[datetime]): Datetime objects, all sharing one timezone for the vectorized path.
+
+    Returns:
+        List[str]: The formatted dates.
+    """
+    try:
+        return pd.DatetimeIndex(timestamps).strftime("%Y-%m-%d").tolist()
+    except ValueError:
+        # Mixed UTC offsets cannot form a DatetimeIndex; format each value in its own offset.
+        # Not reached for dates from convert_timestamps, which already share one timezone.
+        return [dt.strftime("%Y-%m-%d") for dt in timestamps]
+
+
+async def _predict_batches(predictor, batches: List[list]) -> list:
+    """
+    Send prediction batches concurrently, with at most MAX_CONCURRENT_REQUESTS in flight.
+
+    Args:
+        predictor: Vertex AI Predictor instance.
+        batches (List[list]): Batches of prediction instances.
+
+    Returns:
+        list: Inference results, one per batch, in batch order.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    results = await asyncio.gather(
+        *(apredict(predictor, batch, semaphore) for batch in batches), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+    return results
+
+
+def perform_inference(predictor, inputs: List[List[float]], timestamps: List[List[datetime]], horizon: int = 21, batch_size: int = 32) -> list:
     """
     Perform inference using the predictor with specified input data and horizon.
 
+    Series are sent in batches of up to `batch_size` instances per request, so many
+    series share one round-trip. Batches are sent concurrently and their results are
+    merged into a single result. When called from a running event loop, such as a
+    notebook, the batches are sent on a thread pool instead of with `asyncio.run`.
+
     Args:
         predictor: Vertex AI Predictor instance.
         inputs (List[List[float]]): List of lists containing stock price data.
         timestamps (List[List[datetime]]): List of lists containing datetime objects.
         horizon (int): Number of days for the prediction horizon.
+        batch_size (int): Maximum number of instances per prediction request.
 
     Returns:
         list: Inference results from the predictor.
     """
-    instances = []
-    for each_input, each_timestamp in zip(inputs, timestamps):
-        stringified_dates = [dt.strftime("%Y-%m-%d") for dt in each_timestamp]
-        instances.append({
+    # Fields shared by every instance in the request
+    fixed_fields = {"horizon": horizon, "timestamp_format": "%Y-%m-%d"}
+    instances = [
+        {
+            **fixed_fields,
             "input": each_input,
-            "horizon": horizon,
-            "timestamp": stringified_dates,
-            "timestamp_format": "%Y-%m-%d",
-        })
+            "timestamp": format_dates(each_timestamp),
+        }
+        for each_input, each_timestamp in zip(inputs, timestamps)
+    ]
+
+    logger.info("Performing inference with %d instances in batches of %d.", len(instances), batch_size)
+    if len(instances) <= batch_size:
+        return make_inference(predictor, instances)
 
-    logger.info("Performing inference with %d instances.", len(instances))
-    return make_inference(predictor, instances)
+    instance_iter = iter(instances)
+    batches = list(iter(lambda: list(islice(instance_iter, batch_size)), []))
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        results = asyncio.run(_predict_batches(predictor, batches))
+    else:
+        # asyncio.run cannot be nested inside a running loop (e.g. Jupyter); use threads instead
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            results = list(executor.map(lambda batch: make_inference(predictor, batch), batches))
+
+    # Merge per-batch predictions, keeping the metadata of the first response
+    return results[0]._replace(predictions=[p for result in results for p in result.predictions])
 
 
-def save_visualizations(fig: plt.Figure, save_dir: str, file_prefix: str = "forecast") -> None:
+def get_figure(figsize: Tuple[float, float] = (20, 10)) -> Tuple[plt.Figure, plt.Axes]:
+    """
+    Return the shared figure and axes, cleared and ready for a new plot.
+
+    Args:
+        figsize (Tuple[float, float]): Size of the figure in inches.
+
+    Returns:
+        Tuple[plt.Figure, plt.Axes]: The reusable figure and its axes.
+    """
+    global _FIG, _AX
+    if _FIG is None:
+        _FIG, _AX = plt.subplots(figsize=figsize)
+    else:
+        _AX.cla()
+        _FIG.set_size_inches(*figsize)
+    return _FIG, _AX
+
+
+def to_datetime64(dates) -> np.ndarray:
+    """
+    Convert dates to a naive UTC datetime64[ns] array that Matplotlib can plot without per-element conversion.
+
+    Args:
+        dates: Sequence of datetimes or a DatetimeIndex, naive or timezone-aware.
+
+    Returns:
+        np.ndarray: The dates as datetime64[ns], with timezone-aware values converted to UTC.
+    """
+    # utc=True also accepts mixed UTC offsets; naive values are taken as UTC
+    return pd.to_datetime(dates, utc=True).tz_convert(None).to_numpy(dtype="datetime64[ns]")
+
+
+def add_interval_bands(ax: plt.Axes, xs: np.ndarray, bands: List[Tuple[list, list, str, float, str]]) -> List[Patch]:
+    """
+    Draw several shaded intervals sharing one x-axis as a single PolyCollection.
+
+    Equivalent to one `ax.fill_between` call per band, but rendered in a single pass.
+
+    Args:
+        ax (plt.Axes): Axes to draw on.
+        xs (np.ndarray): X coordinates in Matplotlib date units.
+        bands (List[Tuple[list, list, str, float, str]]): (lower, upper, color, alpha, label) per band.
+
+    Returns:
+        List[Patch]: Legend handles for the bands.
+    """
+    verts = [
+        np.concatenate([
+            np.column_stack([xs, np.asarray(lower, dtype=np.float64)]),
+            np.column_stack([xs, np.asarray(upper, dtype=np.float64)])[::-1],
+        ])
+        for lower, upper, _, _, _ in bands
+    ]
+    facecolors = [to_rgba(color, alpha) for _, _, color, alpha, _ in bands]
+    ax.add_collection(PolyCollection(verts, facecolors=facecolors, edgecolors="none"))
+    ax.autoscale_view()
+    return [Patch(facecolor=to_rgba(color, alpha), label=label) for _, _, color, alpha, label in bands]
+
+
+def save_visualizations(fig: plt.Figure, save_dir: str, file_prefix: str = "forecast", dpi: int = 150) -> None:
     """
     Save Matplotlib visualizations to a specified directory.
 
@@ -133,13 +284,14 @@ def save_visualizations(fig: plt.Figure, save_dir: str, file_prefix: str = "fore
         fig (plt.Figure): Matplotlib figure to save.
         save_dir (str): Directory to save the visualization.
         file_prefix (str): Prefix for the saved file name.
+        dpi (int): Resolution of the saved PNG.
     """
     if not os.path.exists(save_dir):
         os.makedirs(save_dir)
         logger.info("Created directory: %s", save_dir)
 
     save_path = os.path.join(save_dir, f"{file_prefix}.png")
-    fig.savefig(save_path, bbox_inches="tight", dpi=300)
+    fig.savefig(save_path, bbox_inches="tight", dpi=dpi, format="png")
     logger.info("Visualization saved to: %s", save_path)
 
 
@@ -159,8 +311,8 @@ def test() -> None:
         inputs, timestamps = prepare_stock_instances(data)
 
         # Load the endpoint name
-        yaml_file_path = "./config/endpoints.yml"
-        endpoint_name = get_endpoint_name(yaml_file_path)
+        endpoints_file_path = "./config/endpoints.jsonl"
+        endpoint_name = get_endpoint_name(endpoints_file_path)
 
         # Create the Vertex AI Predictor
         predictor = create_vertex_ai_predictor(endpoint_name)
@@ -171,20 +323,24 @@ def test() -> None:
 
         # Extract predictions
         predictions = inference_result.predictions[0]
-        point_forecast = predictions["point_forecast"]
-        p10, p20, p50, p80, p90 = predictions["p10"], predictions["p20"], predictions["p50"], predictions["p80"], predictions["p90"]
+        point_forecast, p10, p20, p50, p80, p90 = (
+            np.asarray(predictions[key], dtype=np.float64)
+            for key in ("point_forecast", "p10", "p20", "p50", "p80", "p90")
+        )
 
         # Generate forecast dates
         last_date = timestamps[0][-1]
-        forecast_dates = [last_date + timedelta(days=i + 1) for i in range(len(point_forecast))]
+        forecast_dates = to_datetime64(pd.date_range(last_date + pd.Timedelta(days=1), periods=len(point_forecast), freq="D"))
 
         # Visualization
-        fig, ax = plt.subplots(figsize=(20, 10))
-        ax.plot(timestamps[0], inputs[0], label="Actual Prices", marker="o", linestyle="-", linewidth=2, color="dodgerblue")
-        ax.plot(forecast_dates, point_forecast, label="Forecast (Mean)", marker="o", linestyle="--", linewidth=2, color="orange")
-        ax.fill_between(forecast_dates, p10, p90, color="lightcoral", alpha=0.3, label="P10-P90 Interval")
-        ax.fill_between(forecast_dates, p20, p80, color="gold", alpha=0.5, label="P20-P80 Interval")
-        ax.fill_between(forecast_dates, p50, point_forecast, color="limegreen", alpha=0.7, label="P50-Forecast Interval")
+        fig, ax = get_figure(figsize=(20, 10))
+        ax.plot(to_datetime64(timestamps[0]), np.asarray(inputs[0], dtype=np.float64), label="Actual Prices", marker="o", linestyle="-", linewidth=2, color="dodgerblue", rasterized=True)
+        ax.plot(forecast_dates, point_forecast, label="Forecast (Mean)", marker="o", linestyle="--", linewidth=2, color="orange", rasterized=True)
+        band_handles = add_interval_bands(ax, mdates.date2num(forecast_dates), [
+            (p10, p90, "lightcoral", 0.3, "P10-P90 Interval"),
+            (p20, p80, "gold", 0.5, "P20-P80 Interval"),
+            (p50, point_forecast, "limegreen", 0.7, "P50-Forecast Interval"),
+        ])
 
         ax.set_title("Stock Price Forecast Nvidia", fontsize=20, fontweight="bold")
         ax.set_xlabel("Date", fontsize=16)
@@ -195,7 +351,8 @@ def test() -> None:
         ax.xaxis.set_major_locator(mdates.DayLocator())
         ax.xaxis.set_major_formatter(mdates.DateFormatter("%b %d"))
         fig.autofmt_xdate(rotation=45)
-        ax.legend(fontsize=14, loc="upper left", bbox_to_anchor=(1.05, 1), borderaxespad=0)
+        line_handles, _ = ax.get_legend_handles_labels()
+        ax.legend(handles=line_handles + band_handles, fontsize=14, loc="upper left", bbox_to_anchor=(1.05, 1), borderaxespad=0)
 
         # Save visualization
         save_visualizations(fig, "./data/visuals", "stock_price_forecast_nvidia_1m")
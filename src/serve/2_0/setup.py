@@ -1,14 +1,119 @@
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
 from huggingface_hub import snapshot_download
+from huggingface_hub import hf_hub_download
+from huggingface_hub import HfApi
 from src.config.logging import logger
 from src.config.setup import config
+from google.api_core.exceptions import NotFound
 from google.cloud import storage
 from typing import Optional
+from typing import Iterator
+from typing import Tuple
 from typing import Dict 
 from tqdm import tqdm
+import google_crc32c
+import functools
+import base64
+import threading
+import fnmatch
+import queue
 import time
 import yaml
 import os
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Number of concurrent uploads; each upload is network-bound and independent.
+UPLOAD_MAX_WORKERS = 16
+
+# Number of concurrent Hugging Face file downloads when pipelining a model into GCS.
+DOWNLOAD_MAX_WORKERS = 4
+
+# Downloaded files waiting for upload; limits how far downloads run ahead of the uploads.
+# Every downloaded file still stays in the local directory.
+PIPELINE_QUEUE_SIZE = 8
+
+# Files larger than this are sent as chunked resumable uploads.
+UPLOAD_CHUNK_SIZE = 32 * 1024 * 1024
+
+# Read size used when checksumming local files.
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+
+# Storage client shared by all ModelManager instances, created on first use.
+_STORAGE_CLIENT = None
+
+
+def _storage_client() -> storage.Client:
+    """
+    Returns the shared storage client, creating it on first use.
+
+    Returns:
+    --------
+        storage.Client: The process-wide Google Cloud Storage client.
+    """
+    global _STORAGE_CLIENT
+    if _STORAGE_CLIENT is None:
+        _STORAGE_CLIENT = storage.Client()
+    return _STORAGE_CLIENT
+
+
+def _crc32c_of(local_file_path: str) -> str:
+    """
+    Computes the CRC32C checksum of a local file in the base64 form GCS reports for blobs.
+
+    Args:
+    -----
+        local_file_path : str
+            The file to checksum.
+
+    Returns:
+    --------
+        str: The base64-encoded big-endian CRC32C of the file contents.
+    """
+    checksum = google_crc32c.Checksum()
+    with open(local_file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b""):
+            checksum.update(chunk)
+    return base64.b64encode(checksum.digest()).decode("ascii")
+
+
+@functools.cache
+def _load_hf_token_cached(credentials_path: str, mtime: float) -> str:
+    """
+    Reads the Hugging Face token from the credentials file; cached on its path and modification time.
+
+    Args:
+    -----
+        credentials_path : str
+            Path to the Hugging Face credentials YAML file.
+        mtime : float
+            Modification time of the file, used only as part of the cache key.
+
+    Returns:
+    --------
+        str: The Hugging Face token.
+
+    Raises:
+    -------
+        KeyError: If the `hf_token` key is missing in the YAML file.
+    """
+    try:
+        with open(credentials_path, "r") as file:
+            credentials = yaml.load(file, Loader=SafeLoader)
+        hf_token = credentials["hf_token"]
+        logger.info("Successfully loaded Hugging Face token.")
+        return hf_token
+    except KeyError:
+        logger.error("Hugging Face token not found in the credentials file.")
+        raise KeyError("Hugging Face token not found in the credentials file.")
+    except Exception as e:
+        logger.error(f"Error reading Hugging Face credentials: {str(e)}")
+        raise Exception(f"Error reading Hugging Face credentials: {str(e)}") from e
+
 
 class ModelManager:
     """
@@ -29,14 +134,20 @@ class ModelManager:
     download_model(repo_id: str, local_dir: str) -> None:
         Downloads a model or adapter from Hugging Face Hub to a local directory.
     upload_to_gcs(local_dir: str, gcs_path: Optional[str] = None) -> None:
-        Uploads a local directory to a specified path in Google Cloud Storage.
+        Uploads an already downloaded local directory to a specified path in Google Cloud Storage.
+    transfer_model(repo_id: str, local_dir: str, gcs_path: Optional[str] = None) -> None:
+        Downloads a model file by file and uploads each file as soon as it is on disk.
+    _upload_one(bucket: storage.Bucket, local_file_path: str, blob_path: str) -> None:
+        Uploads a single file to a blob in the given bucket.
+    _iter_files(local_dir: str) -> Iterator[Tuple[str, str]]:
+        Lazily yields the files under a directory with their relative paths.
     process_models(models: Dict[str, Dict[str, str]]) -> None:
         Processes a dictionary of models by downloading and uploading them.
     """
 
     def __init__(self):
         self.bucket_name = config.BUCKET_NAME
-        self.client = storage.Client()
+        self.client = _storage_client()
         self.project_id = config.PROJECT_ID
         self.region = config.REGION
         self.hf_token = self._load_hf_token()
@@ -46,6 +157,8 @@ class ModelManager:
         """
         Loads the Hugging Face token from the credentials file.
 
+        The parsed token is cached until the credentials file changes.
+
         Returns:
         --------
             str: The Hugging Face token.
@@ -60,18 +173,7 @@ class ModelManager:
             logger.error("Hugging Face credentials file not found.")
             raise FileNotFoundError(f"Credentials file {credentials_path} does not exist.")
 
-        try:
-            with open(credentials_path, "r") as file:
-                credentials = yaml.safe_load(file)
-            hf_token = credentials["hf_token"]
-            logger.info("Successfully loaded Hugging Face token.")
-            return hf_token
-        except KeyError:
-            logger.error("Hugging Face token not found in the credentials file.")
-            raise KeyError("Hugging Face token not found in the credentials file.")
-        except Exception as e:
-            logger.error(f"Error reading Hugging Face credentials: {str(e)}")
-            raise Exception(f"Error reading Hugging Face credentials: {str(e)}") from e
+        return _load_hf_token_cached(credentials_path, os.path.getmtime(credentials_path))
 
     def _ensure_bucket_exists(self) -> None:
         """
@@ -121,10 +223,80 @@ class ModelManager:
             logger.error(f"Failed to download {repo_id}: {str(e)}")
             raise Exception(f"Failed to download {repo_id}: {str(e)}") from e
 
+    @staticmethod
+    def _iter_files(local_dir: str) -> Iterator[Tuple[str, str]]:
+        """
+        Lazily yields the files under a directory with their paths relative to it.
+
+        Uses `os.scandir`, so uploads can start as soon as the first file is found.
+        Like `os.walk`, symlinked directories are not descended into.
+
+        Args:
+        -----
+            local_dir : str
+                The directory to traverse.
+
+        Yields:
+        -------
+            Tuple[str, str]: The file path and its path relative to `local_dir`.
+        """
+        stack = [local_dir]
+        while stack:
+            directory = stack.pop()
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif not entry.is_dir():
+                        yield entry.path, os.path.relpath(entry.path, local_dir)
+
+    def _upload_one(self, bucket: storage.Bucket, local_file_path: str, blob_path: str) -> None:
+        """
+        Uploads a single file to a blob in the given bucket.
+
+        The upload is skipped when the blob already exists with the same size and CRC32C.
+
+        Args:
+        -----
+            bucket : storage.Bucket
+                The destination bucket.
+            local_file_path : str
+                The local file to upload.
+            blob_path : str
+                The destination blob path within the bucket.
+        """
+        blob = bucket.blob(blob_path)
+        size = os.path.getsize(local_file_path)
+        try:
+            blob.reload()
+        except NotFound:
+            pass
+        else:
+            if blob.size == size and blob.crc32c == _crc32c_of(local_file_path):
+                logger.info(f"Skipped {local_file_path}; gs://{self.bucket_name}/{blob_path} is unchanged")
+                return
+        if size > UPLOAD_CHUNK_SIZE:
+            blob.chunk_size = UPLOAD_CHUNK_SIZE
+        # Fixed content type skips the mimetypes lookup; CRC32C replaces the default MD5 integrity check
+        with open(local_file_path, "rb") as f:
+            blob.upload_from_file(
+                f,
+                size=size,
+                content_type="application/octet-stream",
+                checksum="crc32c",
+                rewind=True
+            )
+        logger.info(f"Uploaded {local_file_path} to gs://{self.bucket_name}/{blob_path}")
+
     def upload_to_gcs(self, local_dir: str, gcs_path: Optional[str] = None) -> None:
         """
         Uploads a local directory to a specified path in Google Cloud Storage.
 
+        This is the entry point for pushing a model that is already on disk, e.g. one fetched
+        earlier with `download_model`; `transfer_model` covers downloading and uploading together.
+        Files found by `_iter_files` are uploaded concurrently through `_upload_one` on a thread
+        pool sharing this manager's storage client, so unchanged blobs are skipped.
+
         Args:
         -----
             local_dir : str
@@ -144,32 +316,114 @@ class ModelManager:
         bucket = self.client.bucket(self.bucket_name)
 
         try:
-            # Collect all files to upload
-            files_to_upload = []
-            for root, _, files in os.walk(local_dir):
-                for file in files:
-                    local_file_path = os.path.join(root, file)
-                    relative_path = os.path.relpath(local_file_path, local_dir)
-                    blob_path = os.path.join(gcs_path, relative_path)
-                    files_to_upload.append((local_file_path, blob_path))
-
-            # Use tqdm for progress tracking
-            with tqdm(total=len(files_to_upload), desc="Uploading files to GCS", unit="file") as progress_bar:
-                for local_file_path, blob_path in files_to_upload:
-                    blob = bucket.blob(blob_path)
-                    blob.upload_from_filename(local_file_path)
-
-                    # Log the upload and update the progress bar
-                    logger.info(f"Uploaded {local_file_path} to gs://{self.bucket_name}/{blob_path}")
+            # Use tqdm for progress tracking; the total is unknown while the directory is still being traversed
+            with tqdm(total=None, desc="Uploading files to GCS", unit="file") as progress_bar, \
+                    ThreadPoolExecutor(max_workers=UPLOAD_MAX_WORKERS) as executor:
+                # Submit uploads as files are discovered
+                futures = [
+                    executor.submit(self._upload_one, bucket, local_file_path, os.path.join(gcs_path, relative_path))
+                    for local_file_path, relative_path in self._iter_files(local_dir)
+                ]
+                for future in as_completed(futures):
+                    future.result()
                     progress_bar.update(1)
         except Exception as e:
             logger.error(f"Failed to upload files from {local_dir} to GCS: {str(e)}")
             raise Exception(f"Failed to upload files from {local_dir} to GCS: {str(e)}") from e
 
+    def transfer_model(self, repo_id: str, local_dir: str, gcs_path: Optional[str] = None) -> None:
+        """
+        Downloads a model or adapter from Hugging Face Hub and uploads it to Google Cloud Storage.
+
+        Files are fetched one by one on download threads and handed to upload threads through
+        a bounded queue, so uploading overlaps downloading instead of waiting for the whole snapshot.
+
+        Args:
+        -----
+            repo_id : str
+                The Hugging Face repository ID.
+            local_dir : str
+                The local directory where the files will be stored.
+            gcs_path : Optional[str]
+                The GCS path to upload to. Defaults to the root of the bucket.
+
+        Raises:
+        -------
+            Exception: For any errors during the download or upload process.
+        """
+        gcs_path = gcs_path or ""
+        bucket = self.client.bucket(self.bucket_name)
+
+        try:
+            logger.info(f"Starting transfer of {repo_id} to gs://{self.bucket_name}/{gcs_path} via {local_dir}...")
+            filenames = [
+                filename for filename in HfApi().list_repo_files(repo_id, token=self.hf_token)
+                if not fnmatch.fnmatch(filename, "*.lock")
+            ]
+        except Exception as e:
+            logger.error(f"Failed to list files of {repo_id}: {str(e)}")
+            raise Exception(f"Failed to list files of {repo_id}: {str(e)}") from e
+
+        downloaded: queue.Queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        failed = threading.Event()
+        upload_errors = []
+
+        def download(filename: str) -> None:
+            if failed.is_set():
+                return
+            try:
+                local_file_path = hf_hub_download(
+                    repo_id=repo_id,
+                    filename=filename,
+                    local_dir=local_dir,
+                    token=self.hf_token
+                )
+            except Exception:
+                failed.set()
+                raise
+            logger.info(f"Downloaded {filename} from {repo_id}")
+            downloaded.put((local_file_path, filename))
+
+        def upload(progress_bar: tqdm) -> None:
+            # Keep draining after a failure so that blocked downloads can finish
+            while (item := downloaded.get()) is not None:
+                if failed.is_set():
+                    continue
+                local_file_path, filename = item
+                try:
+                    self._upload_one(bucket, local_file_path, os.path.join(gcs_path, filename))
+                except Exception as e:
+                    failed.set()
+                    upload_errors.append(e)
+                    continue
+                progress_bar.update(1)
+
+        try:
+            with tqdm(total=len(filenames), desc="Transferring files to GCS", unit="file") as progress_bar, \
+                    ThreadPoolExecutor(max_workers=UPLOAD_MAX_WORKERS) as uploaders:
+                upload_futures = [uploaders.submit(upload, progress_bar) for _ in range(UPLOAD_MAX_WORKERS)]
+                try:
+                    with ThreadPoolExecutor(max_workers=DOWNLOAD_MAX_WORKERS) as downloaders:
+                        download_futures = [downloaders.submit(download, filename) for filename in filenames]
+                finally:
+                    # One sentinel per upload thread, sent once no more files can arrive
+                    for _ in upload_futures:
+                        downloaded.put(None)
+
+            for future in download_futures + upload_futures:
+                future.result()
+            if upload_errors:
+                raise upload_errors[0]
+            logger.info(f"Successfully transferred {repo_id} to gs://{self.bucket_name}/{gcs_path}.")
+        except Exception as e:
+            logger.error(f"Failed to transfer {repo_id} to GCS: {str(e)}")
+            raise Exception(f"Failed to transfer {repo_id} to GCS: {str(e)}") from e
+
     def process_models(self, models: Dict[str, Dict[str, str]]) -> None:
         """
         Iterates through the models dictionary, downloading from Hugging Face Hub
-        and uploading to Google Cloud Storage.
+        and uploading to Google Cloud Storage. Each file is uploaded as soon as it
+        has been downloaded.
 
         Args:
         -----
@@ -194,20 +448,12 @@ class ModelManager:
                 repo_id: str = model_info['repo_id']
                 local_dir: str = model_info['local_dir']
 
-                # Download the model or adapter
-                download_start = time.time()
-                self.download_model(repo_id, local_dir)
-                download_end = time.time()
-                logger.info(
-                    f"Model {model_name} downloaded successfully. Time taken: {download_end - download_start:.2f} seconds."
-                )
-
-                # Upload the model or adapter to GCS
-                upload_start = time.time()
-                self.upload_to_gcs(local_dir, model_name)
-                upload_end = time.time()
+                # Download the model or adapter and upload it to GCS, overlapping the two
+                transfer_start = time.time()
+                self.transfer_model(repo_id, local_dir, model_name)
+                transfer_end = time.time()
                 logger.info(
-                    f"Model {model_name} uploaded successfully. Time taken: {upload_end - upload_start:.2f} seconds."
+                    f"Model {model_name} transferred successfully. Time taken: {transfer_end - transfer_start:.2f} seconds."
                 )
 
                 total_time = time.time() - start_time
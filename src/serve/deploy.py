@@ -4,7 +4,7 @@ from google.cloud.aiplatform import Model
 from src.config.setup import config
 from src.config.setup import logger
 from datetime import datetime
-import yaml
+import orjson
 import os
 
 
@@ -34,7 +34,7 @@ def create_endpoint() -> Endpoint:
 
         logger.info(f"Successfully created endpoint: {endpoint.resource_name}")
 
-        # Save the endpoint resource name to a YAML file
+        # Save the endpoint resource name to the endpoints file
         save_endpoint_resource_name(endpoint.resource_name)
 
         return endpoint
@@ -46,36 +46,25 @@ def create_endpoint() -> Endpoint:
 
 def save_endpoint_resource_name(resource_name: str) -> None:
     """
-    Saves the endpoint resource name to a YAML file.
+    Appends the endpoint resource name to a JSON Lines file, one endpoint per line.
 
     Args:
         resource_name (str): The resource name of the created endpoint.
     """
     try:
-        file_path = "./config/endpoints.yml"
+        file_path = "./config/endpoints.jsonl"
 
         # Ensure the directory exists
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
-        # Read existing data from the YAML file if it exists
-        if os.path.exists(file_path):
-            with open(file_path, "r") as file:
-                data = yaml.safe_load(file) or {}
-        else:
-            data = {}
-
-        # Add the new endpoint resource name
-        data["endpoints"] = data.get("endpoints", [])
-        data["endpoints"].append(resource_name)
-
-        # Write back to the YAML file
-        with open(file_path, "w") as file:
-            yaml.safe_dump(data, file)
+        # Append the new endpoint without rewriting the existing entries
+        with open(file_path, "ab") as file:
+            file.write(orjson.dumps({"endpoint": resource_name}) + b"\n")
 
         logger.info(f"Endpoint resource name saved to {file_path}")
 
     except Exception as e:
-        logger.error(f"Failed to save endpoint resource name to YAML: {e}")
+        logger.error(f"Failed to save endpoint resource name to {file_path}: {e}")
         raise
 
 
@@ -1,13 +1,20 @@
+from concurrent.futures import ThreadPoolExecutor
 from src.config.logging import logger
 from src.config.setup import config
 from urllib.parse import urlparse
 from google.cloud import storage
 
+# Number of concurrent server-side blob copies.
+COPY_MAX_WORKERS = 32
+
 
 def copy_model_artifacts(source_uri: str, destination_uri: str) -> None:
     """
     Copies model artifacts from a source URI to a destination URI using Google Cloud SDK.
 
+    Blobs are copied server-side in parallel; large blobs are rewritten in multiple calls
+    until GCS reports completion.
+
     Args:
         source_uri (str): The source GCS URI (e.g., gs://bucket-name/path-to-source).
         destination_uri (str): The destination GCS URI (e.g., gs://bucket-name/path-to-destination).
@@ -37,9 +44,9 @@ def copy_model_artifacts(source_uri: str, destination_uri: str) -> None:
         destination_bucket = client.bucket(destination_bucket_name)
 
         # List blobs in the source bucket with the specified prefix
-        blobs = client.list_blobs(source_bucket, prefix=source_prefix)
+        blobs = list(client.list_blobs(source_bucket, prefix=source_prefix))
 
-        for blob in blobs:
+        def _copy_one(blob: storage.Blob) -> None:
             source_blob_name = blob.name
             destination_blob_name = source_blob_name.replace(source_prefix, destination_prefix, 1)
 
@@ -47,8 +54,15 @@ def copy_model_artifacts(source_uri: str, destination_uri: str) -> None:
             source_blob = source_bucket.blob(source_blob_name)
             destination_blob = destination_bucket.blob(destination_blob_name)
 
-            # Rewrite the blob to the destination
-            destination_blob.rewrite(source_blob)
+            # Rewrite the blob to the destination, continuing until the copy completes
+            token, _, _ = destination_blob.rewrite(source_blob)
+            while token is not None:
+                token, _, _ = destination_blob.rewrite(source_blob, token=token)
+            logger.info("Copied %s to %s", source_blob_name, destination_blob_name)
+
+        with ThreadPoolExecutor(max_workers=COPY_MAX_WORKERS) as executor:
+            # Consume the results so any copy failure is raised here
+            list(executor.map(_copy_one, blobs))
 
         logger.info("Model artifacts copied successfully from %s to %s", source_uri, destination_uri)
 
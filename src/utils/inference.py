@@ -2,15 +2,18 @@ from src.invoke.helper import load_endpoints
 from src.config.logging import logger
 
 
-def get_endpoint_name(yaml_file_path: str) -> str:
+def get_endpoint_name(endpoints_file_path: str) -> str:
     """
-    Loads endpoints from the given YAML configuration and returns the first one.
+    Loads endpoints from the given configuration file and returns the first one.
+
+    The parsed file is cached by `load_endpoints` on its absolute path and modification
+    time, so repeated calls do not re-read the file until it changes.
     
-    :param yaml_file_path: Path to the YAML file containing endpoints.
+    :param endpoints_file_path: Path to the file containing endpoints.
     :return: The name of the first endpoint found.
     :raises ValueError: If no endpoints are found.
     """
-    endpoints = load_endpoints(yaml_file_path)
+    endpoints = load_endpoints(endpoints_file_path)
     if not endpoints:
         logger.error("No endpoints found in the configuration file.")
         raise ValueError("Endpoints configuration is empty.")
@@ -1,11 +1,20 @@
 from src.config.logging import logger 
+from pathlib import Path
 from typing import Optional
 from typing import Dict 
 from typing import Any 
+import pandas as pd
+import tempfile
+import hashlib
 import json 
 import yaml
 import os
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 def load_yaml(filename: str) -> Dict[str, Any]:
     """
@@ -24,7 +33,7 @@ def load_yaml(filename: str) -> Dict[str, Any]:
     """
     try:
         with open(filename, 'r') as file:
-            return yaml.safe_load(file)
+            return yaml.load(file, Loader=SafeLoader)
     except FileNotFoundError:
         logger.error(f"File '{filename}' not found.")
         raise
@@ -65,6 +74,53 @@ def load_json(filename: str) -> Optional[Dict[str, Any]]:
         raise
 
 
+def read_csv_cached(file_path: str, **read_csv_kwargs: Any) -> pd.DataFrame:
+    """
+    Read a CSV file into a DataFrame, reusing a Parquet sidecar written on a previous load.
+
+    The sidecar lives next to the CSV and is keyed by the read options, so callers reading
+    different columns of the same file do not share it. It is reused only while it is at
+    least as new as the CSV.
+
+    Args:
+        file_path (str): The path to the CSV file.
+        **read_csv_kwargs (Any): Options forwarded to `pd.read_csv`.
+
+    Returns:
+        pd.DataFrame: The loaded data.
+
+    Raises:
+        FileNotFoundError: If the CSV file is not found.
+    """
+    csv_path = Path(file_path)
+    csv_mtime = csv_path.stat().st_mtime
+    options_key = hashlib.blake2b(repr(sorted(read_csv_kwargs.items())).encode(), digest_size=4).hexdigest()
+    sidecar = csv_path.with_suffix(f".{options_key}.parquet")
+
+    try:
+        if sidecar.stat().st_mtime >= csv_mtime:
+            return pd.read_parquet(sidecar)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable Parquet sidecar '{sidecar}': {e}")
+
+    df = pd.read_csv(csv_path, **read_csv_kwargs)
+    try:
+        # Write to a temp file and rename, so an interrupted or concurrent run never leaves a truncated sidecar
+        fd, tmp_path = tempfile.mkstemp(dir=sidecar.parent, prefix=f"{sidecar.stem}.", suffix=".tmp.parquet")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                df.to_parquet(tmp_file, compression="zstd")
+            os.replace(tmp_path, sidecar)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        logger.warning(f"Failed to write Parquet sidecar '{sidecar}': {e}")
+    return df
+
+
 def read_file(path: str) -> Optional[str]:
     """
     Reads the content of a markdown file and returns it as a text object.